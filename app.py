@@ -1,18 +1,29 @@
 # app.py (Final Code for Render Deployment)
 
 import os
+import asyncio
+import concurrent.futures
+import copy
+import functools
+import hashlib
 import json
+import threading
+import time
+from collections import Counter, OrderedDict
 from datetime import datetime
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from typing import List
 
 # --- FIXED IMPORTS for LangChain Core ---
+from langchain.globals import set_llm_cache
 from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.caches import InMemoryCache
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser 
+from langchain_core.output_parsers import JsonOutputParser
 from werkzeug.middleware.proxy_fix import ProxyFix
 # --- END FIXED IMPORTS ---
 
@@ -47,18 +58,491 @@ app = Flask(__name__)
 # VITAL FIX: Apply ProxyFix to resolve Render 404 routing issues
 app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_host=1) 
 
-CORS(app) 
+CORS(app)
 
+# Swap Flask's JSON provider for orjson: encoding the nested dicts the parsers
+# return is 2-5x faster than stdlib json and allocates less. Optional: without
+# orjson installed the default provider stays in place.
+try:
+    import orjson
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+except ImportError:
+    print("orjson not installed, using Flask's default JSON provider")
+
+# One shared client for the whole process: the SDK keeps a pooled, keep-alive
+# HTTP connection to the Gemini endpoint, so reusing this instance amortizes
+# TCP + TLS setup across requests instead of paying it per call.
 llm = ChatGoogleGenerativeAI(
     model="gemini-2.5-flash",
     temperature=0.0,
     google_api_key=GEMINI_API_KEY
 )
 
-def get_today_string():
+# Global LangChain LLM cache: duplicate rendered prompts are short-circuited
+# inside the model call itself, at the message-hash level. This catches repeats
+# the response-level lru_cache misses (e.g. after its entries are evicted).
+set_llm_cache(InMemoryCache())
+
+# --- REDIS L2 RESPONSE CACHE ---
+# The in-process LRU dies with every cold start or worker restart. When a
+# REDIS_URL is configured, finished responses are also written to Redis with a
+# one-day TTL so all workers and redeploys share hits. Optional: without the
+# env var the app runs on the in-process caches alone.
+REDIS_URL = os.environ.get("REDIS_URL")
+
+if REDIS_URL:
+    import redis
+    # The socket timeouts matter: a blackholed (hung, not refused) Redis must
+    # fail fast and fall through to the LLM, not block a request — or the
+    # batcher loop — until the Gunicorn timeout.
+    redis_client = redis.Redis(
+        connection_pool=redis.ConnectionPool.from_url(
+            REDIS_URL,
+            max_connections=32,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+    )
+else:
+    redis_client = None
+
+REDIS_TTL_SECONDS = 86400
+
+
+def _l2_key(route, *parts):
+    """Stable Redis key for a cached response: sha256(route|text[|date])."""
+    return hashlib.sha256("|".join((route,) + parts).encode()).hexdigest()
+
+
+# --- SEMANTIC CACHE FOR SUGGESTIONS (GPTCache) ---
+# Typeahead sends near-identical prefixes ("buy gr", "buy gro") that yield
+# near-identical completions. GPTCache answers by embedding similarity, so a
+# close-enough earlier prefix serves the request without calling Gemini.
+# Optional: if gptcache (and its onnx embedding model) is not installed,
+# the app falls back to exact-match caching only.
+# Only prefixes at least this cosine-similar reuse an earlier answer; the
+# gptcache default of 0.8 is loose enough to hand back suggestions for an
+# unrelated task.
+SEMANTIC_SIMILARITY_THRESHOLD = 0.92
+
+try:
+    from gptcache import Config
+    from gptcache.adapter.api import init_similar_cache
+    from gptcache.adapter.api import get as semantic_get, put as semantic_put
+
+    SEMANTIC_CACHE_AVAILABLE = True
+except Exception as e:
+    print(f"GPTCache unavailable, semantic suggest cache disabled: {e}")
+    SEMANTIC_CACHE_AVAILABLE = False
+
+_SEMANTIC_CACHE_PID = None
+_SEMANTIC_CACHE_LOCK = threading.Lock()
+
+
+def _semantic_cache_ready():
+    """Initialize gptcache lazily in the current process; True once usable.
+
+    Same pattern as the suggest batcher: with Gunicorn's preload_app the
+    module is imported in the master, and the ONNX session and sqlite/faiss
+    handles gptcache opens are not fork-safe, so each worker must build its
+    own store on first use. The per-pid data_dir also keeps two workers from
+    writing the same sqlite/faiss files.
+    """
+    global _SEMANTIC_CACHE_PID, SEMANTIC_CACHE_AVAILABLE
+    if not SEMANTIC_CACHE_AVAILABLE:
+        return False
+    if _SEMANTIC_CACHE_PID == os.getpid():
+        return True
+    with _SEMANTIC_CACHE_LOCK:
+        if _SEMANTIC_CACHE_PID != os.getpid():
+            try:
+                init_similar_cache(
+                    data_dir=f"/tmp/gptcache_suggest_{os.getpid()}",
+                    config=Config(similarity_threshold=SEMANTIC_SIMILARITY_THRESHOLD),
+                )
+            except Exception as e:
+                print(f"GPTCache init failed, semantic suggest cache disabled: {e}")
+                SEMANTIC_CACHE_AVAILABLE = False
+                return False
+            _SEMANTIC_CACHE_PID = os.getpid()
+    return True
+
+@functools.lru_cache(maxsize=1)
+def _today(hour_bucket):
     return datetime.now().strftime("%Y-%m-%d")
 
 
+def get_today_string():
+    # The value only changes once a day; formatting it per request is wasted
+    # work on the hot path. Cache per wall-clock hour so the string (and with
+    # it the analyze prompt) stays byte-identical between refreshes, which is
+    # what makes the response cache and any provider-side prompt cache hit.
+    return _today(int(time.time() // 3600))
+
+
+# --- CHAINS (built once at import time) ---
+# Rebuilding the parser, prompt and chain per request re-serializes the
+# Pydantic JSON schema and re-allocates the whole pipeline every call. Only
+# the date and the user text vary, so build everything once and pass those
+# two as variables.
+
+ANALYZE_PARSER = JsonOutputParser(pydantic_object=TaskAnalysis)
+
+# get_format_instructions() walks the Pydantic schema and dumps it to JSON —
+# constant output, so serialize exactly once per process. The byte-stable
+# strings also keep the rendered prompts identical across requests, which is
+# what upstream prompt caches key on.
+TASK_ANALYSIS_FORMAT = ANALYZE_PARSER.get_format_instructions()
+
+ANALYZE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system",
+     "You are a professional task analysis engine. The current date is {date}. "
+     "Your sole purpose is to return ONLY a valid JSON object. "
+     "Strictly format any date found as YYYY-MM-DD. \n"
+     "{format_instructions}"
+    ),
+    ("user", "{user_input}"),
+]).partial(format_instructions=TASK_ANALYSIS_FORMAT)
+
+ANALYZE_CHAIN = ANALYZE_PROMPT | llm | ANALYZE_PARSER
+
+SUGGEST_PARSER = JsonOutputParser(pydantic_object=SuggestionList)
+
+SUGGESTION_FORMAT = SUGGEST_PARSER.get_format_instructions()
+
+SUGGEST_PROMPT = ChatPromptTemplate.from_messages([
+    ("system",
+     "You are a helpful AI completer. Generate 5 unique suggestions to complete the user's partial text. "
+     "The response format must be:\n"
+     "{format_instructions}"
+    ),
+    ("user", "{user_input}"),
+]).partial(format_instructions=SUGGESTION_FORMAT)
+
+SUGGEST_CHAIN = SUGGEST_PROMPT | llm | SUGGEST_PARSER
+
+# Reused Pydantic v2 TypeAdapters: their compiled (Rust-core) validators are
+# built once here and shared by every call. JsonOutputParser only parses the
+# JSON — it never runs schema validation — so these also catch malformed LLM
+# output before it is cached or sent to a client.
+TASK_ANALYSIS_ADAPTER = TypeAdapter(TaskAnalysis)
+SUGGESTION_ADAPTER = TypeAdapter(SuggestionList)
+
+
+# --- IN-PROCESS RESPONSE CACHE ---
+# The chains run with temperature=0.0, so the same input always produces the
+# same output: repeated prompts can be answered from memory instead of paying
+# a full Gemini round-trip. Hit/miss counts are exposed at /healthz.
+
+CACHE_STATS = Counter()
+
+def _normalize(text):
+    # Widen the hit rate: " Buy milk " and "buy milk" are the same request.
+    return text.strip().lower()
+
+
+class _LRUCache:
+    """Minimal LRU dict for async chain results.
+
+    functools.lru_cache cannot wrap a coroutine (it would cache the one-shot
+    coroutine object, not the result), so the async handlers use this instead.
+    Locked like lru_cache was: gthread serves requests from many threads, and
+    an unlocked get could race a concurrent put's eviction between the lookup
+    and the move_to_end.
+    """
+    _MISS = object()
+
+    def __init__(self, maxsize=4096):
+        self._data = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key, self._MISS)
+            if value is not self._MISS:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+
+_ANALYZE_CACHE = _LRUCache(maxsize=4096)
+_SUGGEST_CACHE = _LRUCache(maxsize=4096)
+
+
+async def _analyze(task_text, current_date_string):
+    """Run the analysis chain for a normalized task text. Cached per (text, date)."""
+    result = await ANALYZE_CHAIN.ainvoke({
+        "date": current_date_string,
+        "user_input": task_text,
+    })
+    return TASK_ANALYSIS_ADAPTER.validate_python(result).model_dump()
+
+
+class _SuggestBatcher:
+    """Coalesces bursts of suggestion requests into one batched Gemini call.
+
+    Typeahead fires several requests within milliseconds; instead of one API
+    call each, requests arriving within a 20 ms window (or the first 8, if a
+    burst fills up sooner) are sent together via chain.abatch, amortizing the
+    per-call HTTP overhead across the batch.
+
+    Flask runs every async view on its own short-lived event loop, so the
+    batcher owns a dedicated loop in a daemon thread. Requests hand their text
+    over with a thread-safe put and wait on a concurrent future.
+    """
+    WINDOW_SECONDS = 0.02
+    MAX_BATCH = 8
+
+    def __init__(self):
+        self._loop = None
+        self._queue = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_started(self):
+        # Lazy, per-process startup: with Gunicorn's preload_app the module is
+        # imported in the master, but threads do not survive fork, so each
+        # worker must spawn its own batcher loop on first use.
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._loop = asyncio.new_event_loop()
+            self._queue = asyncio.Queue()
+            threading.Thread(target=self._run, name="suggest-batcher", daemon=True).start()
+            self._pid = os.getpid()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._drain())
+
+    async def _drain(self):
+        while True:
+            # Block for the first item, then keep collecting until the
+            # window closes or the batch is full.
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.WINDOW_SECONDS
+            while len(batch) < self.MAX_BATCH:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Fire and forget: awaiting the flush here would serialize the
+            # batches behind each Gemini round-trip. Scheduling it as a task
+            # lets the loop go straight back to collecting the next batch
+            # while earlier ones are still in flight.
+            asyncio.ensure_future(self._flush(batch))
+
+    async def _flush(self, batch):
+        try:
+            partials = [partial for partial, _ in batch]
+            results = [None] * len(batch)
+            misses = list(range(len(batch)))
+
+            # L2 reads for the whole batch in one pipelined round-trip,
+            # instead of one Redis RTT per request.
+            keys = None
+            if redis_client is not None:
+                # Keys use the normalized text (matching _cached_call); the
+                # prompt below gets the raw text.
+                keys = [_l2_key("suggest", _normalize(partial)) for partial in partials]
+                try:
+                    # redis-py is synchronous: run the pipeline in a thread so
+                    # the round-trip doesn't block the batcher's event loop
+                    # (and with it every other in-flight flush).
+                    cached = await asyncio.to_thread(self._pipelined_get, keys)
+                except Exception as e:
+                    print(f"Redis L2 batch read failed: {e}")
+                    cached = [None] * len(keys)
+                misses = []
+                for i, value in enumerate(cached):
+                    if value is not None:
+                        CACHE_STATS["suggest_l2_hits"] += 1
+                        results[i] = json.loads(value)
+                    else:
+                        misses.append(i)
+
+            if misses:
+                llm_results = await SUGGEST_CHAIN.abatch(
+                    [{"user_input": partials[i]} for i in misses]
+                )
+                for i, result in zip(misses, llm_results):
+                    results[i] = SUGGESTION_ADAPTER.validate_python(result).model_dump()
+
+                # Bulk L2 writes, again one pipelined round-trip off-loop.
+                if redis_client is not None:
+                    try:
+                        await asyncio.to_thread(
+                            self._pipelined_setex,
+                            [(keys[i], json.dumps(results[i])) for i in misses],
+                        )
+                    except Exception as e:
+                        print(f"Redis L2 batch write failed: {e}")
+
+            for (_, future), result in zip(batch, results):
+                # A waiter may have been cancelled (client gone); setting a
+                # result on its future would raise InvalidStateError and fail
+                # the whole batch through the except below.
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    @staticmethod
+    def _pipelined_get(keys):
+        pipe = redis_client.pipeline()
+        for key in keys:
+            pipe.get(key)
+        return pipe.execute()
+
+    @staticmethod
+    def _pipelined_setex(items):
+        pipe = redis_client.pipeline()
+        for key, value in items:
+            pipe.setex(key, REDIS_TTL_SECONDS, value)
+        pipe.execute()
+
+    def submit(self, partial_task):
+        """Queue a partial text for the next batch; returns a concurrent future."""
+        self._ensure_started()
+        future = concurrent.futures.Future()
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, (partial_task, future))
+        return future
+
+
+_SUGGEST_BATCHER = _SuggestBatcher()
+
+
+async def _suggest(partial_task):
+    """Run the suggestion chain for a normalized partial text. Cached per text."""
+    # L2: semantic lookup. A similar-enough earlier prefix answers this one.
+    # Same rule as Redis: a broken semantic store (e.g. its sqlite/faiss
+    # files contended between workers) must never fail the request, so any
+    # gptcache error just falls through to the batcher.
+    if _semantic_cache_ready():
+        try:
+            cached = semantic_get(partial_task)
+        except Exception as e:
+            print(f"GPTCache read failed: {e}")
+            cached = None
+        if cached is not None:
+            CACHE_STATS["suggest_semantic_hits"] += 1
+            return json.loads(cached)
+
+    result = await asyncio.wrap_future(_SUGGEST_BATCHER.submit(partial_task))
+
+    if _semantic_cache_ready():
+        try:
+            semantic_put(partial_task, json.dumps(result))
+        except Exception as e:
+            print(f"GPTCache write failed: {e}")
+
+    return result
+
+
+# Single-flight map: when N concurrent requests miss the cache on the same
+# key, only the first actually runs the chain; the rest await its future.
+# concurrent futures (not asyncio ones) because Flask gives every async view
+# its own event loop and gthread serves requests from different threads.
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+async def _cached_call(route, cache, chain_fn, key_parts, call_args, use_l2=True):
+    """Call an async chain function through L1 (LRU) and L2 (Redis), recording hits.
+
+    key_parts (normalized text) only keys the caches and the single-flight
+    map; call_args carries the raw text the chain actually receives, so the
+    model sees the user's original casing ("ASAP", names) while " Buy milk "
+    and "buy milk" still share one cache entry.
+
+    The suggest route passes use_l2=False: its L2 traffic goes through the
+    batcher, which pipelines the reads/writes for a whole batch in one RTT.
+    """
+    cached = cache.get(key_parts)
+    if cached is not _LRUCache._MISS:
+        CACHE_STATS[f"{route}_hits"] += 1
+        # Shallow-copy so callers can't mutate the cached dict in place.
+        return copy.copy(cached)
+
+    key = _l2_key(route, *key_parts)
+
+    # Single-flight: follow an identical call that is already in flight
+    # instead of spawning a duplicate Gemini request.
+    with _INFLIGHT_LOCK:
+        flight = _INFLIGHT.get(key)
+        if flight is None:
+            flight = concurrent.futures.Future()
+            _INFLIGHT[key] = flight
+            is_leader = True
+        else:
+            is_leader = False
+
+    if not is_leader:
+        CACHE_STATS[f"{route}_coalesced"] += 1
+        return copy.copy(await asyncio.wrap_future(flight))
+
+    try:
+        # L2: shared across workers and restarts. A flaky Redis must never
+        # take requests down, so failures just fall through to the LLM call.
+        use_l2 = use_l2 and redis_client is not None
+        if use_l2:
+            try:
+                l2_value = redis_client.get(key)
+            except Exception as e:
+                print(f"Redis L2 read failed: {e}")
+                l2_value = None
+            if l2_value is not None:
+                CACHE_STATS[f"{route}_l2_hits"] += 1
+                result = json.loads(l2_value)
+                cache.put(key_parts, result)
+                flight.set_result(result)
+                return copy.copy(result)
+
+        CACHE_STATS[f"{route}_misses"] += 1
+        result = await chain_fn(*call_args)
+        cache.put(key_parts, result)
+        flight.set_result(result)
+
+        if use_l2:
+            try:
+                redis_client.setex(key, REDIS_TTL_SECONDS, json.dumps(result))
+            except Exception as e:
+                print(f"Redis L2 write failed: {e}")
+
+        return copy.copy(result)
+    except Exception as e:
+        if not flight.done():
+            flight.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+
 # --- ROUTE 1: Serves the Frontend HTML (Necessary for a combined deployment) ---
 # NOTE: This assumes you have moved your index.html into a folder named /static
 @app.route("/", defaults={"path": "index.html"})
@@ -69,7 +553,7 @@ def serve_frontend(path):
 
 # --- ROUTE 2: /api/analyze (Task Analysis) ---
 @app.route("/api/analyze", methods=["POST"])
-def analyze_handler():
+async def analyze_handler():
     try:
         data = request.get_json()
         task_text = data.get("task_text")
@@ -78,26 +562,15 @@ def analyze_handler():
         if not task_text:
             return jsonify({"error": "Missing task_text"}), 400
 
-        # LangChain Setup for Analysis Chain
-        parser = JsonOutputParser(pydantic_object=TaskAnalysis)
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", 
-             f"You are a professional task analysis engine. The current date is {current_date_string}. "
-             "Your sole purpose is to return ONLY a valid JSON object. "
-             "Strictly format any date found as YYYY-MM-DD. \n"
-             "{format_instructions}" # This is the placeholder for the parser's instructions
-            ),
-            ("user", "{user_input}"),
-        ])
-        
-        # FIX: Inject the formatting instructions into the prompt template using .partial()
-        prompt = prompt.partial(format_instructions=parser.get_format_instructions())
-        
-        chain = prompt | llm | parser
-        
-        # Invoke the LLM, supplying the variable the prompt expects
-        result = chain.invoke({"user_input": task_text})
+        # Cached chain call: repeat prompts for the same day are free. The
+        # caches key on the normalized text, but Gemini gets the raw text so
+        # casing ("ASAP", proper names) survives into the analysis. The
+        # await releases the worker during the Gemini round-trip, so one
+        # worker can hold many in-flight analyses instead of blocking.
+        task_text = task_text.strip()
+        result = await _cached_call("analyze", _ANALYZE_CACHE, _analyze,
+                                    (_normalize(task_text), current_date_string),
+                                    (task_text, current_date_string))
 
         return jsonify(result)
 
@@ -111,7 +584,7 @@ def analyze_handler():
 
 # --- ROUTE 3: /api/suggest (Dynamic Suggestions) ---
 @app.route("/api/suggest", methods=["POST"])
-def suggest_handler():
+async def suggest_handler():
     try:
         data = request.get_json()
         partial_task = data.get("partial_task")
@@ -119,24 +592,13 @@ def suggest_handler():
         if not partial_task:
             return jsonify({"error": "Missing partial_task"}), 400
 
-        # LangChain Setup for Suggestions Chain
-        parser = JsonOutputParser(pydantic_object=SuggestionList)
-        
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", 
-             "You are a helpful AI completer. Generate 5 unique suggestions to complete the user's partial text. "
-             f"The response format must be:\n"
-             "{format_instructions}"
-            ),
-            ("user", "{user_input}"),
-        ])
-        
-        # FIX: Inject the formatting instructions into the prompt template using .partial()
-        prompt = prompt.partial(format_instructions=parser.get_format_instructions())
-
-        chain = prompt | llm | parser
-        
-        result = chain.invoke({"user_input": partial_task})
+        # Cached chain call: identical partial text never hits Gemini twice.
+        # Keyed on the normalized text, invoked with the raw text so the
+        # completions keep the user's casing.
+        partial_task = partial_task.strip()
+        result = await _cached_call("suggest", _SUGGEST_CACHE, _suggest,
+                                    (_normalize(partial_task),), (partial_task,),
+                                    use_l2=False)
 
         return jsonify(result)
 
@@ -145,6 +607,43 @@ def suggest_handler():
         return jsonify({"error": "Internal Server Error during suggestion generation."}), 500
 
 
+# --- ROUTE 4: /api/suggest/stream (Incremental suggestions via SSE) ---
+# The JSON endpoint above only answers once Gemini has generated all 5
+# suggestions. This variant streams the parser's progressively-completed
+# output as Server-Sent Events, so the browser can render the first
+# suggestion at time-to-first-token instead of time-to-last-token. GET with
+# a query parameter, because EventSource can only issue GET requests.
+@app.route("/api/suggest/stream", methods=["GET"])
+def suggest_stream_handler():
+    partial_task = request.args.get("partial_task")
+
+    if not partial_task:
+        return jsonify({"error": "Missing partial_task"}), 400
+
+    def generate():
+        try:
+            # WSGI streams from a sync generator, so this uses chain.stream
+            # rather than astream; each chunk is the parsed JSON so far.
+            for chunk in SUGGEST_CHAIN.stream({"user_input": partial_task.strip()}):
+                yield f"data: {json.dumps(chunk)}\n\n"
+            yield "data: [DONE]\n\n"
+        except Exception as e:
+            print(f"ERROR in suggest stream: {e}")
+            yield f"data: {json.dumps({'error': 'stream failed'})}\n\n"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# --- ROUTE 5: /healthz (Liveness + cache observability) ---
+@app.route("/healthz", methods=["GET"])
+def healthz_handler():
+    return jsonify({"status": "ok", "cache": dict(CACHE_STATS)})
+
+
 # --- STARTUP COMMAND FOR RENDER (Gunicorn) ---
 if __name__ == '__main__':
     # This block is used for local development only.
@@ -0,0 +1,24 @@
+# gunicorn.conf.py (Render start command: gunicorn -c gunicorn.conf.py app:app)
+#
+# Flask is a WSGI app, so uvicorn's ASGI workers don't apply here. gthread
+# workers give concurrent request serving: each request gets a thread, and the
+# async views spend their time awaiting the Gemini round-trip rather than
+# burning CPU, so a generous thread count per worker is cheap.
+
+import os
+
+bind = "0.0.0.0:" + os.environ.get("PORT", "5000")
+
+workers = 2
+worker_class = "gthread"
+threads = 16
+timeout = 120
+
+# Import app.py once in the master so the compiled chains, format-instruction
+# constants and cache structures are built a single time and shared
+# copy-on-write with the forked workers, instead of being re-imported per
+# worker. State that is not fork-safe — the suggest batcher's event-loop
+# thread, gptcache's ONNX/sqlite/faiss handles, the LLM client's HTTP
+# connections — is deliberately created lazily per worker on first use, so
+# nothing with a native handle crosses the fork.
+preload_app = True